@@ -4,6 +4,8 @@
 IMPLEMENTATION NOTES
 
 This python script contains no dependencies other than stdlib, so it's easy to install.
+If the orjson package happens to be installed then we use it for json, since it's several
+times faster than stdlib json, and POSTs can be 100k+; otherwise we use stdlib json.
 
 We launch the underlying codex binary with the same command-line arguments, but
 (1) we set RUST_LOG="codex_core=trace,codex_mcp_server=info" so that the "codex mcp"
@@ -19,7 +21,14 @@ does that then it'll all just go into the previous logfile.
 The log files is an html+js preamble followed by lines of JSONL in trailing comment that
 never closes. This way, (1) we can append more lines of jsonl, (2) browsers will silently
 accept the unclosed comment, (3) our html preamble can obtain the content of that comment
-and render it.
+and render it. The jsonl is compressed, since it's highly redundant and long sessions would
+otherwise run to tens of MB. All the jsonl written to a file by one process forms a single
+deflate stream, so that each event can refer back to text in earlier ones (the same tool
+calls, outputs and json keys crop up again and again). After each event we sync-flush the
+stream and append what we have so far as one base64 line; the first line of each stream is
+prefixed with '#'. We never finish the stream, so more can be appended at any time; the
+browser terminates it with an empty final block before decompressing it with its built-in
+DecompressionStream. (Older logs have plain jsonl lines, which the preamble still understands.)
 
 The html rendering happens at two levels. First, the html knows how to render arbitrary
 json objects with recursively expandable nodes. Html has <details> nodes specifically for this.
@@ -52,17 +61,22 @@ to align with those labels.
 Escaping is subtle. First, when the html renders json, it escapes any characters it finds in there.
 Second, when html renders {"RENDER":true} blocks then it declines to escape label/value (so as to
 allow the python code to insert its own html markup), hence the python is responsible for escaping
-content it got from stderr before putting it into label/value. Third, to be able to append the
-jsonl in a trailing comment, we escape any '-->' sequences to stop them from closing the comment.
+content it got from stderr before putting it into label/value. Third, the jsonl lives in a trailing
+comment, so it mustn't contain '--' lest that close the comment; base64 never does.
 """
 
 from __future__ import annotations
 
 import os
 import sys
+import base64
+import zlib
+import functools
 import re
 import json
+import queue
 import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal, Tuple, cast, TypedDict
@@ -70,6 +84,10 @@ try:
     from typing import NotRequired # type: ignore
 except ImportError:
     from typing_extensions import NotRequired # type: ignore
+try:
+    import orjson # type: ignore
+except ImportError:
+    orjson = None
 
 
 preamble = """\
@@ -123,13 +141,61 @@ preamble = """\
             }
         }
 
-        window.addEventListener('DOMContentLoaded', () => {
+        function fromBase64(line) {
+            return Uint8Array.from(atob(line), c => c.charCodeAt(0));
+        }
+
+        async function inflate(chunks) {
+            const FINAL_BLOCK = new Uint8Array([0x03, 0x00]);
+            const stream = new Blob([...chunks, FINAL_BLOCK]).stream().pipeThrough(new DecompressionStream('deflate-raw'));
+            return await new Response(stream).text();
+        }
+
+        async function parseStream(lines) {
+            // A stream can be damaged, e.g. if the process was killed mid-write. Since every
+            // line was sync-flushed, any prefix of the lines decodes, so we keep the longest one.
+            for (let n = lines.length; n > 0; n--) {
+                try {
+                    const jsonl = await inflate(lines.slice(0, n).map(fromBase64));
+                    const values = jsonl.split('\\n').filter(Boolean).map(line => JSON.parse(line));
+                    return n === lines.length ? values : [...values, { ERROR: `${lines.length - n} lines of log couldn't be decoded` }];
+                } catch {
+                }
+            }
+            return [{ ERROR: `${lines.length} lines of log couldn't be decoded` }];
+        }
+
+        function parseJson(line) {
+            try {
+                return [JSON.parse(line)];
+            } catch {
+                return [{ ERROR: "A line of log couldn't be parsed" }];
+            }
+        }
+
+        async function parseLines(lines) {
+            const parts = [];  // each is either a plain json line, or the lines of one deflate stream
+            for (const line of lines) {
+                if (line.startsWith('{')) {
+                    parts.push(line);  // older logs were plain jsonl
+                } else if (line.startsWith('#') || !Array.isArray(parts.at(-1))) {
+                    parts.push([line.replace(/^#/, '')]);
+                } else {
+                    parts.at(-1).push(line);
+                }
+            }
+            const values = await Promise.all(parts.map(part => Array.isArray(part) ? parseStream(part) : parseJson(part)));
+            return values.flat();
+        }
+
+        window.addEventListener('DOMContentLoaded', async () => {
             const output = document.createElement('div');
             document.body.appendChild(output);
 
             if (document.lastChild && document.lastChild.nodeType === Node.COMMENT_NODE && document.lastChild.data.trim()) {
-                for (const line of document.lastChild.data.split(/\\r?\\n/).filter(Boolean)) {
-                    output.appendChild(buildNode(JSON.parse(line), 'json:'));
+                const lines = document.lastChild.data.split(/\\r?\\n/).filter(Boolean);
+                for (const value of await parseLines(lines)) {
+                    output.appendChild(buildNode(value, 'json:'));
                     output.appendChild(document.createElement('hr'));
                 }
             }
@@ -142,46 +208,134 @@ preamble = """\
 <!--
 """
 
+RE_RUST_ESCAPE = re.compile(r'\\(.)')
+RUST_ESCAPES = {'\\': '\\', 'n': '\n', 'r': '\r', 't': '\t', '"': '"'}
+RE_SUBMISSION_TEXT = re.compile(r'Text\s*\{\s*text:\s*"((?:[^"\\]|\\.)*)"')
+RE_WORD = re.compile(r'\S{1,81}')  # a longer word would fill short()'s 80 chars by itself
+RE_NOT_WORD = re.compile(r'[^\w \-]+', re.ASCII)
+
+
+JSON_DECODER = json.JSONDecoder()  # its raw_decode parses json starting part-way through a line
+
+
+def json_loads(s: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass  # orjson is stricter than json (e.g. NaN, huge ints), so let json have the final say
+    return json.loads(s)
+
+
+def json_loads_at(line: str, start: int) -> Any:
+    """Parses the json value that starts at line[start], ignoring anything after it.
+    orjson can't start part-way through a string, nor tolerate trailing text, so in those
+    cases we fall back to json's raw_decode; either way the result is what json would give.
+    (Except that orjson reads integers beyond 64 bits as floats, which OpenAI json never has.)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(line[start:])
+        except orjson.JSONDecodeError:
+            pass
+    return JSON_DECODER.raw_decode(line, start)[0]
+
+
+def json_dumps(value: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits, which json handles
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def line_kind(line: str) -> Literal["configuring", "submission", "post", "sse"] | None:
+    """The stderr lines we care about are recognized by a keyword that comes before the first '{'
+    on the line; after that it's json (or rust debug output) that could contain anything.
+    Most lines are trace noise that match nothing, so we stick to plain substring searches,
+    which are much cheaper than a regex."""
+    brace = line.find("{")
+    end = brace if brace >= 0 else len(line)
+    if line.find("Configuring session", 0, end) >= 0:
+        return "configuring"
+    elif line.find("Submission", 0, end) >= 0:
+        return "submission"
+    elif brace < 0:
+        return None
+    elif line.find("POST to", 0, brace) >= 0:
+        return "post"
+    elif line.find("SSE event: ", 0, brace) >= 0:
+        return "sse"
+    else:
+        return None
+
+
 def unescape_rust(s: str) -> str:
-    return s.replace('\\\\', '\x00').replace('\\n', '\n').replace('\\r', '\r').replace('\\t', '\t').replace('\\"', '"').replace('\x00', '\\')
+    return RE_RUST_ESCAPE.sub(lambda m: RUST_ESCAPES.get(m.group(1), m.group(0)), s)
+
+
+def user_request(text: str) -> str:
+    """The codex extension prefixes the user's prompt with context, ending in a
+    '## My request for Codex:' header. This returns what comes after that header."""
+    _, header, request = text.partition("## My request for Codex:")
+    return request.lstrip() if header else text
 
 
 def esc(value: str) -> str:
     return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
+@functools.lru_cache(maxsize=256)
+def esc_name(value: str) -> str:
+    """esc, for the tool names and content types in labels: there are few of them, and they recur."""
+    return esc(value)
+
+
+def identical(prev: Any, new: Any) -> bool:
+    """Whether two json values are identical, in the sense of calculate_json_delta.
+    That's exactly python's deep equality, which walks the structure in C without
+    allocating, so it's much cheaper than building a delta just to throw it away.
+    (It's also cheaper than caching content hashes: every POST is freshly parsed, so its
+    subtrees never share ids with the previous one, and hashing them costs more than ==.)"""
+    return prev is new or prev == new
+
+
 def calculate_json_delta(prev: Any, new: Any) -> Tuple[bool, Any]:
     """Given two json values, returns a bool for whether they're identical,
     plus a json representation of the difference, intended for humans to read.
     The json representation always has the same type as 'new'.
+    Keys in the delta come in the order they appear in 'new', after any removed keys.
     """
-    if isinstance(prev, dict) and isinstance(new, dict):
+    if prev is new:
+        return (True, {} if isinstance(new, dict) else [] if isinstance(new, list) else new)
+    elif isinstance(prev, dict) and isinstance(new, dict):
         prevl, newl = cast(dict[str,Any], prev), cast(dict[str,Any], new)
-        prev_keys = set(prevl.keys())
-        new_keys = set(newl.keys())
         delta: dict[str, Any] = {}
-
-        for k in sorted(prev_keys - new_keys):
-            delta[f"-{k}"] = None
-        for k in sorted(new_keys - prev_keys):
-            delta[f"+{k}"] = newl[k]
-        for k in sorted(prev_keys & new_keys):
-            identical, subdelta = calculate_json_delta(prevl[k], newl[k])
-            if not identical:
-                if isinstance(subdelta, list) and subdelta[0] == "...":
-                    delta[f"{k}+"] = subdelta[1:]
-                else:
-                    delta[f"*{k}"] = subdelta
+        for k in prevl:
+            if k not in newl:
+                delta[f"-{k}"] = None
+        for k, v in newl.items():
+            if k not in prevl:
+                delta[f"+{k}"] = v
+                continue
+            if identical(prevl[k], v):
+                continue
+            _, subdelta = calculate_json_delta(prevl[k], v)
+            if isinstance(subdelta, list) and subdelta[:1] == ["..."]:
+                delta[f"{k}+"] = subdelta[1:]
+            else:
+                delta[f"*{k}"] = subdelta
         return (len(delta) == 0, delta)
     elif isinstance(prev, list) and isinstance(new, list):
         prevl, newl = cast(list[Any], prev), cast(list[Any], new)
-        if len(prevl) <= len(newl):
-            all_true = all(calculate_json_delta(a,b)[0] for (a,b) in zip(prevl, newl))
-            if all_true and len(prevl) == len(newl):
-                return (True, [])
-            elif all_true and len(prevl) < len(newl):
-                return (False, ["...", *newl[len(prevl):]])
-        return (False, newl)
+        if len(prevl) > len(newl):
+            return (False, newl)
+        for a, b in zip(prevl, newl):
+            if not identical(a, b):
+                return (False, newl)
+        if len(prevl) == len(newl):
+            return (True, [])
+        return (False, ["...", *newl[len(prevl):]])
     else:
         return (prev == new, new)
 
@@ -226,12 +380,20 @@ class Render(TypedDict):
 
 
 def short(s: str) -> str:
-    lines = s.splitlines()
-    return " ".join(s.split()[:15])[:80] + f"... [{len(lines)} lines]"
+    # s can be 100k+, so we only look as far as the first few words, rather than splitting it all.
+    words: list[str] = []
+    length = 0
+    for m in RE_WORD.finditer(s):
+        words.append(m.group())
+        length += len(words[-1]) + 1
+        if len(words) == 15 or length > 80:
+            break
+    lines = s.count("\n") + (1 if s and not s.endswith("\n") else 0)
+    return " ".join(words)[:80] + f"... [{lines} lines]"
 
 def render_function_call(i: dict[str, Any], bold: bool) -> Render:
     try:
-        arguments = json.loads(i["arguments"])
+        arguments = json_loads(i["arguments"])
     except (json.JSONDecodeError, TypeError):
         arguments = i["arguments"]
     shortargs = "..."
@@ -240,7 +402,7 @@ def render_function_call(i: dict[str, Any], bold: bool) -> Render:
         if len(command) >=3 and command[0] == "bash" and command[1].startswith("-"):
             shortargs = esc(command[2][:50].replace("\n", " ") + ("..." if len(command[2])> 50 else ""))
     b1,b2 = ("<b>", "</b>") if bold else ("", "")
-    return {"RENDER": True, "label": f"function_call: {b1}{esc(i['name'])}({shortargs}){b2}", "content": arguments}
+    return {"RENDER": True, "label": f"function_call: {b1}{esc_name(i['name'])}({shortargs}){b2}", "content": arguments}
 
 
 def render_delta(delta: Any) -> Any:
@@ -263,21 +425,21 @@ def render_delta(delta: Any) -> Any:
             tools_content: list[Render] = []
             for tool in d["tools"]:
                 tool = cast(dict[str,Any], tool)
-                tools_content.append({"RENDER": True, "label": f"{esc(tool['type'])} tool: {esc(tool.get('name',''))}", "content": tool.get("parameters",{}) | {"description": tool.get('description','')}})
+                tools_content.append({"RENDER": True, "label": f"{esc_name(tool['type'])} tool: {esc_name(tool.get('name',''))}", "content": tool.get("parameters",{}) | {"description": tool.get('description','')}})
             content.append({"RENDER": True, "label": "tools: ", "value": f"[{len(d['tools'])} tools]", "content": tools_content})
         if "input" in d or "input+" in d:
             input_blocks: list[dict[str, Any]] = d.get("input", d.get("input+", []))
             for i in input_blocks:
                 if i["type"] == "message":
                     for c in cast(list[dict[str,Any]], i["content"]):
-                        value = short(re.split(r'## My request for Codex:\s*', c["text"], maxsplit=1)[-1])
+                        value = short(user_request(c["text"]))
                         b1,b2 = ("<b>", "</b>") if c["type"] == "input_text" else ("", "")
-                        content.append({"RENDER": True, "label": f"{esc(c['type'])}: ", "value": f"{b1}{esc(value)}{b2}", "content": c["text"]})
+                        content.append({"RENDER": True, "label": f"{esc_name(c['type'])}: ", "value": f"{b1}{esc(value)}{b2}", "content": c["text"]})
                 elif i["type"] == "function_call":
                     content.append(render_function_call(i, bold=False))
                 elif i["type"] == "function_call_output":                    
                     try:
-                        output = json.loads(i["output"])                        
+                        output = json_loads(i["output"])                        
                     except json.JSONDecodeError:
                         output = i["output"]
                     if isinstance(output, dict) and "output" in output and isinstance(output["output"], str):
@@ -298,19 +460,88 @@ def render_response(response: dict[str, Any]) -> Any:
             if output["type"] == "reasoning":
                 reasoning: list[Render] = []
                 for summary in output["summary"]:
-                    reasoning.append({"RENDER": True, "label": f"{esc(summary['type'])}: ", "value": f"{esc(short(summary['text']))}", "content": summary["text"]})
+                    reasoning.append({"RENDER": True, "label": f"{esc_name(summary['type'])}: ", "value": f"{esc(short(summary['text']))}", "content": summary["text"]})
                 content.append({"RENDER": True, "label": f"reasoning: [{len(str(output.get('encrypted_content', '')))} bytes]", "open": True, "content": reasoning})
             elif output["type"] == "function_call":
                 content.append(render_function_call(output, bold=True))
             elif output["type"] == "message":
                 for c in output["content"]:
                     text = str(c.get('text', '???'))
-                    content.append({"RENDER": True, "label": f"{esc(c['type'])}: ","value": f"<b>{esc(short(text))}</b>", "content": text})
+                    content.append({"RENDER": True, "label": f"{esc_name(c['type'])}: ","value": f"<b>{esc(short(text))}</b>", "content": text})
         content.append({"RENDER": True, "label": "[raw json]", "content": response})
         return {"RENDER": True, "label": f"[{datetime.now().strftime('%H:%M:%S')}] response.completed", "open": True, "content": content}
     except Exception:
         return response
 
+
+class LogFile:
+    """The log file is append-only. We keep it open between writes, and only reopen when
+    its name changes (i.e. on a new session). Writes are gathered in memory, and only go to
+    disk once enough has accumulated or when main calls flush() because it has no more stderr
+    waiting. This way a burst of events costs a single write, but the log can still be viewed
+    while the session is in progress.
+    Each write is compressed into a deflate stream that starts afresh whenever we open a
+    file, as described in the IMPLEMENTATION NOTES."""
+
+    FLUSH_BYTES = 1 << 16
+
+    def __init__(self) -> None:
+        self.path: Path | None = None
+        self.fd: int | None = None
+        self.buf: list[bytes] = []
+        self.buf_bytes = 0
+        self.deflate = zlib.compressobj(6, zlib.DEFLATED, -15)
+
+    def write(self, path: Path, s: str) -> None:
+        if self.fd is None or path != self.path:
+            self.flush()
+            self._close()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            need_preamble = not path.exists()
+            # We write bytes straight to the fd, since our lines are already encoded.
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+            fd = os.open(path, flags, 0o644)
+            self.fd, self.path = fd, path
+            if need_preamble:
+                self.buf.append(preamble.encode("utf-8"))
+            self.deflate = zlib.compressobj(6, zlib.DEFLATED, -15)
+            prefix = b"#"
+        else:
+            prefix = b""
+        chunk = self.deflate.compress(s.encode("utf-8")) + self.deflate.flush(zlib.Z_SYNC_FLUSH)
+        line = prefix + base64.b64encode(chunk) + b"\n"
+        self.buf.append(line)
+        self.buf_bytes += len(line)
+        if self.buf_bytes >= self.FLUSH_BYTES:
+            self.flush()
+
+    def flush(self) -> None:
+        try:
+            if self.fd is not None and self.buf:
+                data = memoryview(b"".join(self.buf))
+                while data:
+                    data = data[os.write(self.fd, data):]
+        except OSError:
+            # What we failed to write is lost, and with it the deflate stream's continuity.
+            # So drop the fd: the next write will reopen the file and start a fresh stream.
+            self._close()
+            raise
+        finally:
+            self.buf.clear()
+            self.buf_bytes = 0
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._close()
+
+    def _close(self) -> None:
+        if self.fd is not None:
+            fd, self.fd = self.fd, None
+            os.close(fd)
+
+
 def main() -> int:
     # We can't use shutil.which("codex") to find the underlying codex binary. That will
     # pick up whichever codex is installed in the user's PATH, e.g. /opt/homebrew/bin/codex.
@@ -324,6 +555,7 @@ def main() -> int:
         env=os.environ.copy() | {"RUST_LOG": "codex_core=trace,codex_mcp_server=info"},
         stderr=subprocess.PIPE,
         text=True,
+        errors="replace",  # stderr isn't guaranteed to be utf-8, and we mustn't stop draining it
         bufsize=1,  # line-buffered
     )
 
@@ -332,54 +564,73 @@ def main() -> int:
     prompt: str | None = None
     prev: Any = None
     poisoned: bool = False
+    logfile = LogFile()
 
     def log(jj: Any) -> None:
         nonlocal prompt, timestamp
         prompt = prompt or ""
         log = Path(os.path.expanduser("~/codex-trace")) / f"{timestamp.strftime('%Y-%m-%dT%H%M%S')}{prompt}.html"
-        log.parent.mkdir(parents=True, exist_ok=True)
-        need_preamble = not log.exists()
-        with log.open("a", encoding="utf-8") as f:
-            if need_preamble:
-                f.write(preamble)
-            f.write(json.dumps(jj, ensure_ascii=False).replace(">", "\\u003e").replace("--", "-\\u002d") + "\n")
+        logfile.write(log, json_dumps(jj) + "\n")
+
+    # Interpreting a line can take a while (e.g. a 100k+ POST, or a slow disk). Meanwhile
+    # a separate thread keeps draining stderr into a queue, up to the queue's bound, so codex
+    # doesn't block on a full pipe while we process a line.
+    lines: queue.Queue[str | None] = queue.Queue(maxsize=1024)
+
+    def pump(stderr: Any) -> None:
+        try:
+            for line in stderr:
+                lines.put(line)
+        finally:
+            lines.put(None)  # even if reading failed, else the main loop would wait forever
 
-    for line in proc.stderr:
+    threading.Thread(target=pump, args=(proc.stderr,), daemon=True).start()
+
+    # Whatever ends the loop (even KeyboardInterrupt or SystemExit), buffered events get written.
+    try:
+        for line in iter(lines.get, None):
+            try:
+                kind = None if poisoned else line_kind(line)
+                if kind is None:
+                    pass
+                elif kind == "configuring":
+                    timestamp = datetime.now()
+                    prompt = None
+                    prev = None                
+                elif kind == "submission":
+                    m = RE_SUBMISSION_TEXT.search(line)
+                    text = unescape_rust(m.group(1) if m else "")
+                    text = user_request(text)
+                    text = RE_NOT_WORD.sub('', text)
+                    text = " ".join(text.strip().split(" ")[:10])[:50].strip()
+                    prompt = prompt if prompt is not None else " - " + text if text else ""
+                elif kind == "post":
+                    try:
+                        post = json_loads_at(line, line.find("{"))
+                    except json.JSONDecodeError:
+                        post = {"ERROR": "Malformed json"}
+                    _, delta = calculate_json_delta(prev, post)
+                    log(render_delta(delta))
+                    prev = post
+                elif kind == "sse":
+                    try:
+                        response = json_loads_at(line, line.find("{"))
+                    except json.JSONDecodeError:
+                        response = {}
+                    if response.get("type","") == "response.completed":
+                        log(render_response(response))
+                if lines.empty():
+                    logfile.flush()  # nothing more is waiting for us, so now's the time to write
+            except Exception as e:
+                print(f"Error processing line: {e}", file=sys.stderr)
+                # The above error message will go to the "Codex" output pane in VSCode.
+                # We must continue to drain proc's stderr, else it will block...
+                poisoned = True
+    finally:
         try:
-            if poisoned:
-                pass
-            elif re.search(r"^[^{]*Configuring session", line):
-                timestamp = datetime.now()
-                prompt = None
-                prev = None                
-            elif re.search(r"^[^{]*Submission", line):
-                m = re.search(r'Text\s*\{\s*text:\s*"((?:[^"\\]|\\.)*)"', line)
-                text = unescape_rust(m.group(1) if m else "")
-                text = re.split(r'## My request for Codex:\s*', text, maxsplit=1)[-1]
-                text = re.sub(r'[^\w \-]+', '', text, flags=re.ASCII)
-                text = " ".join(text.strip().split(" ")[:10])[:50].strip()
-                prompt = prompt if prompt is not None else " - " + text if text else ""
-            elif re.search(r"^[^{]*POST to[^{]*{", line):
-                try:
-                    post = json.loads(line[line.find("{"):].strip())
-                except json.JSONDecodeError:
-                    post = {"ERROR": "Malformed json"}
-                _, delta = calculate_json_delta(prev, post)
-                log(render_delta(delta))
-                prev = post
-            elif re.search(r"^[^{]*SSE event: [^{]*{", line):
-                try:
-                    response = json.loads(line[line.find("{"):].strip())
-                except json.JSONDecodeError:
-                    continue
-                if response.get("type","") != "response.completed":
-                    continue
-                log(render_response(response))
+            logfile.close()
         except Exception as e:
-            print(f"Error processing line: {e}", file=sys.stderr)
-            # The above error message will go to the "Codex" output pane in VSCode.
-            # We must continue to drain proc's stderr, else it will block...
-            poisoned = True
+            print(f"Error writing log: {e}", file=sys.stderr)
 
     return proc.wait()
 